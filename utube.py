@@ -1,55 +1,169 @@
 # ------------------- Imports -------------------
 import streamlit as st
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import YouTubeTranscriptApi, YouTubeRequestFailed
 from pytube import YouTube
-import pytube
-from transformers import pipeline
-import nltk
-from nltk.tokenize import word_tokenize
 import readtime
 import textstat
 import re
+import math
+import hashlib
+from pathlib import Path
+import random
+import time
+import requests
+import diskcache
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-# ------------------- NLTK setup -------------------
-nltk.download('punkt')
+# ------------------- Disk Cache -------------------
+@st.cache_resource
+def get_disk_cache():
+    """Open the on-disk cache once per process; LRU entries are evicted once it passes 500 MB"""
+    return diskcache.Cache(
+        str(Path(__file__).parent / ".cache" / "youtube-summary"),
+        size_limit=500 * 2**20, eviction_policy="least-recently-used"
+    )
 
 # ------------------- Summarization Pipeline -------------------
-summarization = pipeline("summarization")
+SUMMARIZATION_MODEL = "sshleifer/distilbart-cnn-12-6"
 
-# ------------------- Helper Functions -------------------
+@st.cache_resource
+def get_summarizer_precision():
+    """Return the precision get_summarizer loads on this host, without loading the model"""
+    import torch
+    if torch.cuda.is_available():
+        return "fp16"
+    if torch.backends.quantized.engine == "none":
+        return "fp32"
+    return "int8"
 
-def get_transcript(video_url):
-    """Retrieve transcript text from a YouTube video URL"""
+@st.cache_resource
+def get_summarizer():
+    """Load the summarization pipeline once per process; returns the pipeline and its precision"""
+    # transformers and torch are imported lazily so the page renders before they load
+    import torch
+    from transformers import pipeline
+    precision = get_summarizer_precision()
+    if precision == "fp16":
+        return pipeline("summarization", model=SUMMARIZATION_MODEL, device=0, torch_dtype=torch.float16), "fp16"
+    summarizer = pipeline("summarization", model=SUMMARIZATION_MODEL, device=-1)
+    # int8 dynamic quantization of the Linear layers, only where a quantized engine is available
+    if precision == "fp32":
+        return summarizer, "fp32"
     try:
-        video_id = pytube.extract.video_id(video_url)
-        transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-        corpus = " ".join([element["text"].replace("\n", " ") for element in transcript_list])
+        torch.quantization.quantize_dynamic(
+            summarizer.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    except Exception:
+        # A failed in-place pass can leave the model half converted, so reload it in fp32
+        return pipeline("summarization", model=SUMMARIZATION_MODEL, device=-1), "fp32"
+    return summarizer, "int8"
+
+# ------------------- Regex Patterns -------------------
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:[^&#]*&)*v=|watch/|embed/|shorts/|live/|v/|e/)|youtu\.be/)'
+    r'([a-zA-Z0-9_-]{11})',
+    re.IGNORECASE
+)
+_WORD_RE = re.compile(r"\w+")
+
+# ------------------- Helper Functions -------------------
+
+def get_video_id(video_url):
+    """Extract the 11-character video ID from a YouTube URL"""
+    match = _VIDEO_ID_RE.search(video_url or "")
+    return match.group(1) if match else None
+
+@st.cache_data(max_entries=500, show_spinner=False)
+def fetch_transcript(video_id, max_attempts=3, base_delay=0.5, max_delay=4.0):
+    """Fetch and join the transcript for a video ID; cached on disk across restarts"""
+    key = ("transcript", video_id)
+    corpus = get_disk_cache().get(key)
+    if corpus is not None:
         return corpus
+    # Only transient request failures are retried; disabled or missing transcripts raise at once
+    for attempt in range(max_attempts):
+        try:
+            transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+            break
+        except (YouTubeRequestFailed, requests.exceptions.RequestException):
+            if attempt == max_attempts - 1:
+                raise
+            time.sleep(min(max_delay, base_delay * 2 ** attempt) + random.uniform(0, base_delay))
+    corpus = " ".join([element["text"].replace("\n", " ") for element in transcript_list])
+    get_disk_cache().set(key, corpus)
+    return corpus
+
+def get_transcript(video_id, transcript_future):
+    """Return transcript text from a pending fetch, warning if it is unavailable"""
+    if not video_id:
+        st.warning("⚠️ Could not find a video ID in that URL.")
+        return None
+    try:
+        return transcript_future.result()
     except Exception as e:
         st.warning("⚠️ Could not retrieve transcript. It may be disabled or unavailable.")
         return None
 
-def get_metadata(video_url):
-    """Return author, keywords, length, views, description"""
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def fetch_metadata(video_id):
+    """Fetch author, keywords, length, views, description from YouTube; cached per video ID"""
+    yt_object = YouTube(f"https://www.youtube.com/watch?v={video_id}")
+    return yt_object.author, yt_object.keywords, yt_object.length, yt_object.views, yt_object.description
+
+def get_metadata(metadata_future):
+    """Return author, keywords, length, views, description from a pending fetch"""
+    if metadata_future is None:
+        return None, None, None, None, None
     try:
-        yt_object = YouTube(video_url)
-        author = yt_object.author
-        keywords = yt_object.keywords
-        length = yt_object.length
-        views = yt_object.views
-        description = yt_object.description
-        return author, keywords, length, views, description
+        return metadata_future.result()
     except Exception as e:
         st.warning("⚠️ Could not retrieve video metadata.")
         return None, None, None, None, None
 
-def get_summary(corpus, max_length=150):
+def chunk_corpus(corpus, tokenizer, margin=24):
+    """Split the transcript into near-equal token windows that fit the summarization model's input limit"""
+    max_tokens = min(tokenizer.model_max_length, 1024) - margin
+    ids = tokenizer(corpus, add_special_tokens=False)['input_ids']
+    if not ids:
+        return []
+    # Equal-sized windows avoid a short tail chunk that the model would pad out with invented text
+    chunk_tokens = math.ceil(len(ids) / max(1, math.ceil(len(ids) / max_tokens)))
+    return [ids[i:i + chunk_tokens] for i in range(0, len(ids), chunk_tokens)]
+
+def summary_cache_key(precision, corpus, max_length, min_length, batch_size):
+    """Disk cache key for a summary: model, precision, transcript hash and generation arguments"""
+    corpus_hash = hashlib.sha256(corpus.encode()).hexdigest()
+    return ("summary", f"{SUMMARIZATION_MODEL}:{precision}", corpus_hash, max_length, min_length, batch_size)
+
+@st.cache_data(max_entries=500, show_spinner=False)
+def summarize(corpus, max_length=150, min_length=50, batch_size=8):
+    """Summarize the transcript chunk by chunk; cached on disk keyed by model and transcript content"""
+    # The model is only loaded on a disk cache miss
+    key = summary_cache_key(get_summarizer_precision(), corpus, max_length, min_length, batch_size)
+    summary_text = get_disk_cache().get(key)
+    if summary_text is not None:
+        return summary_text
+    summarizer, precision = get_summarizer()
+    windows = chunk_corpus(corpus, summarizer.tokenizer)
+    if not windows:
+        return ""
+    results = summarizer(
+        [summarizer.tokenizer.decode(w) for w in windows], max_length=max_length,
+        min_length=min(min_length, min(len(w) for w in windows)), do_sample=False,
+        batch_size=batch_size, truncation=True
+    )
+    summary_text = " ".join(r['summary_text'] for r in results)
+    # Stored under the precision actually loaded, in case int8 quantization fell back to fp32
+    get_disk_cache().set(summary_cache_key(precision, corpus, max_length, min_length, batch_size), summary_text)
+    return summary_text
+
+def get_summary(corpus, max_length=150, min_length=50, batch_size=8):
     """Generate summary using HuggingFace transformers"""
     if not corpus:
         return "⚠️ No transcript available to summarize."
     try:
-        summary_text = summarization(corpus, max_length=max_length)[0]['summary_text']
-        return summary_text
+        return summarize(corpus, max_length, min_length, batch_size)
     except Exception as e:
         st.warning("⚠️ Error during summarization.")
         return None
@@ -61,7 +175,7 @@ def get_summary_analysis(summary):
     try:
         read_time = readtime.of_text(summary)
         text_complexity = textstat.flesch_reading_ease(summary)
-        tokenized_words = word_tokenize(summary)
+        tokenized_words = _WORD_RE.findall(summary.lower())
         lexical_richness = round(len(set(tokenized_words)) / len(tokenized_words), 2) if tokenized_words else 0
         num_sentences = textstat.sentence_count(summary)
         return read_time, text_complexity, lexical_richness, num_sentences
@@ -74,11 +188,23 @@ def get_summary_analysis(summary):
 st.title("🎯 YouTube Summarizer")
 st.header("This application helps you get the summary of a YouTube video.")
 
-video_url = st.text_input(
-    "Enter YouTube video URL: [Try https://www.youtube.com/watch?v=_FdDgJAw-YM]"
-)
+# The form batches the URL input so typing does not trigger script reruns
+with st.form("video_form"):
+    video_url = st.text_input(
+        "Enter YouTube video URL: [Try https://www.youtube.com/watch?v=_FdDgJAw-YM]"
+    )
+    submitted = st.form_submit_button("Get Summary")
+
+if submitted:
 
-if st.button("Get Summary"):
+    # ---------------- Fetch metadata and transcript concurrently ----------------
+    video_id = get_video_id(video_url)
+    # Workers carry the script's context so the cached fetchers can run off the main thread
+    with ThreadPoolExecutor(
+        max_workers=2, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())
+    ) as executor:
+        metadata_future = executor.submit(fetch_metadata, video_id) if video_id else None
+        transcript_future = executor.submit(fetch_transcript, video_id) if video_id else None
 
     # ---------------- Video Section ----------------
     st.header("Video")
@@ -88,7 +214,7 @@ if st.button("Get Summary"):
     # ---------------- Metadata Section ----------------
     st.header("Metadata")
     with st.expander("View Metadata"):
-        author, keywords, length, views, description = get_metadata(video_url)
+        author, keywords, length, views, description = get_metadata(metadata_future)
         st.subheader("Author"); st.write(author)
         st.subheader("Keywords"); st.write(keywords)
         st.subheader("Length (seconds)"); st.write(length)
@@ -96,7 +222,7 @@ if st.button("Get Summary"):
         st.subheader("Description"); st.write(description)
 
     # ---------------- Transcript Section ----------------
-    transcript_corpus = get_transcript(video_url)
+    transcript_corpus = get_transcript(video_id, transcript_future)
     st.header("Transcript")
     with st.expander("View Transcript"):
         st.write(transcript_corpus or "Transcript unavailable.")